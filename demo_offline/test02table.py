@@ -20,11 +20,31 @@ try:
                 "INSERT INTO test (num, data) VALUES (%s, %s)",
                 (100, "abc'def"))
 
+            # Load many records with a single COPY operation: it is much
+            # faster than running an INSERT for each record.
+            records = [(i, f"data {i}") for i in range(100)]
+            with cur.copy("COPY test (num, data) FROM STDIN") as copy:
+                for record in records:
+                    copy.write_row(record)
+
             # Query the database and obtain data as Python objects.
-            cur.execute("SELECT * FROM test")
+            # stream() returns the records one at a time as they arrive from
+            # the server, without buffering the whole result in memory.
+            for record in cur.stream("SELECT * FROM test"):
+                print(record)
 
-            result = cur.fetchall()
-            print(result)
+            # Load numeric columns into a numpy structured array for analysis.
+            # Binary results spare parsing the numbers from their text
+            # representation, and the rowcount allows to preallocate the array.
+            try:
+                import numpy as np
+            except ImportError:
+                print("numpy not installed: skipping the numpy example")
+            else:
+                cur.execute("SELECT id, num FROM test", binary=True)
+                dtype = np.dtype([("id", "i4"), ("num", "i4")])
+                arr = np.fromiter(cur, dtype=dtype, count=cur.rowcount)
+                print(arr["num"].sum(), arr["num"].mean())
 
 except Exception as e:
     print("Connection failed:", e)
\ No newline at end of file
@@ -17,10 +17,13 @@ try:
             cur.execute("CREATE GRAPH my_graph;")
             cur.execute("SET graph_path = my_graph;")
             cur.execute("CREATE (:Person {name: 'Alice'})-[:KNOWS]->(:Person {name: 'Bob'});")
+
+        # 서버 측 커서: 결과를 itersize 행 단위로 나누어 가져옴 (FETCH FORWARD)
+        with conn.cursor("match_cur") as cur:
+            cur.itersize = 200
             cur.execute("MATCH (n) RETURN n;")
-            
-            result = cur.fetchall()
-            print(result)
+            for record in cur:
+                print(record)
 
 except Exception as e:
     print("Connection failed:", e)
\ No newline at end of file
@@ -19,14 +19,16 @@ try:
             cur.execute("CREATE (:v {name: 'AgensGraph'});")
             conn.commit();
 
-            cur.execute("MATCH (n) RETURN n;")
-
             ## agensgraph-python sample에서 제시한 fechone()은 안 됨.
             #v = cur.fetchone()[0]
             #print(v.props['name'])
-            
-            result = cur.fetchall()
-            print(result)            
+
+        # 서버 측 커서: 결과를 itersize 행 단위로 나누어 가져옴 (FETCH FORWARD)
+        with conn.cursor("match_cur") as cur:
+            cur.itersize = 200
+            cur.execute("MATCH (n) RETURN n;")
+            for record in cur:
+                print(record)
 
 except Exception as e:
     print("Connection failed:", e)
\ No newline at end of file
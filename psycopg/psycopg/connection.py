@@ -18,7 +18,7 @@ from collections.abc import Generator, Iterator
 
 from . import pq
 from . import errors as e
-from . import waiting
+from .waiting import wait, wait_conn
 from .abc import AdaptContext, ConnDict, ConnParam, Params, PQGen, Query, RV
 from ._tpc import Xid
 from .rows import Row, RowFactory, tuple_row, args_row
@@ -101,7 +101,7 @@ class Connection(BaseConnection[Row]):
             try:
                 conninfo = make_conninfo("", **attempt)
                 gen = cls._connect_gen(conninfo, timeout=timeout)
-                rv = waiting.wait_conn(gen, interval=_WAIT_INTERVAL)
+                rv = wait_conn(gen, interval=_WAIT_INTERVAL)
             except e._NO_TRACEBACK as ex:
                 if len(attempts) > 1:
                     logger.debug(
@@ -281,9 +281,7 @@ class Connection(BaseConnection[Row]):
             return
 
         if capabilities.has_cancel_safe():
-            waiting.wait_conn(
-                self._cancel_gen(timeout=timeout), interval=_WAIT_INTERVAL
-            )
+            wait_conn(self._cancel_gen(timeout=timeout), interval=_WAIT_INTERVAL)
         else:
             self.cancel()
 
@@ -407,14 +405,14 @@ class Connection(BaseConnection[Row]):
         fd (i.e. not on connect and reset).
         """
         try:
-            return waiting.wait(gen, self.pgconn.socket, interval=interval)
+            return wait(gen, self.pgconn.socket, interval=interval)
         except _INTERRUPTED:
             if self.pgconn.transaction_status == ACTIVE:
                 # On Ctrl-C, try to cancel the query in the server, otherwise
                 # the connection will remain stuck in ACTIVE state.
                 self._try_cancel(timeout=5.0)
                 try:
-                    waiting.wait(gen, self.pgconn.socket, interval=interval)
+                    wait(gen, self.pgconn.socket, interval=interval)
                 except e.QueryCanceled:
                     pass  # as expected
             raise
@@ -15,7 +15,7 @@ from collections.abc import AsyncGenerator, AsyncIterator
 
 from . import pq
 from . import errors as e
-from . import waiting
+from .waiting import wait_async, wait_conn_async
 from .abc import AdaptContext, ConnDict, ConnParam, Params, PQGen, Query, RV
 from ._tpc import Xid
 from .rows import Row, AsyncRowFactory, tuple_row, args_row
@@ -116,7 +116,7 @@ class AsyncConnection(BaseConnection[Row]):
             try:
                 conninfo = make_conninfo("", **attempt)
                 gen = cls._connect_gen(conninfo, timeout=timeout)
-                rv = await waiting.wait_conn_async(gen, interval=_WAIT_INTERVAL)
+                rv = await wait_conn_async(gen, interval=_WAIT_INTERVAL)
             except e._NO_TRACEBACK as ex:
                 if len(attempts) > 1:
                     logger.debug(
@@ -297,7 +297,7 @@ class AsyncConnection(BaseConnection[Row]):
             return
 
         if capabilities.has_cancel_safe():
-            await waiting.wait_conn_async(
+            await wait_conn_async(
                 self._cancel_gen(timeout=timeout), interval=_WAIT_INTERVAL
             )
         else:
@@ -429,14 +429,14 @@ class AsyncConnection(BaseConnection[Row]):
         fd (i.e. not on connect and reset).
         """
         try:
-            return await waiting.wait_async(gen, self.pgconn.socket, interval=interval)
+            return await wait_async(gen, self.pgconn.socket, interval=interval)
         except _INTERRUPTED:
             if self.pgconn.transaction_status == ACTIVE:
                 # On Ctrl-C, try to cancel the query in the server, otherwise
                 # the connection will remain stuck in ACTIVE state.
                 await self._try_cancel(timeout=5.0)
                 try:
-                    await waiting.wait_async(gen, self.pgconn.socket, interval=interval)
+                    await wait_async(gen, self.pgconn.socket, interval=interval)
                 except e.QueryCanceled:
                     pass  # as expected
             raise
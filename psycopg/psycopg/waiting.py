@@ -15,7 +15,7 @@ import sys
 import select
 import logging
 import selectors
-from asyncio import get_event_loop, wait_for, Event, TimeoutError
+from asyncio import get_event_loop, wait_for, Future, TimeoutError
 from selectors import DefaultSelector
 
 from . import errors as e
@@ -31,6 +31,10 @@ READY_R = Ready.R
 READY_W = Ready.W
 READY_RW = Ready.RW
 
+# Map the (read, write) readiness flags, packed as `r | w << 1`, to the value
+# to send to the generators.
+_READY_FROM_RW = (READY_NONE, READY_R, READY_W, READY_RW)
+
 logger = logging.getLogger(__name__)
 
 
@@ -50,18 +54,23 @@ def wait_selector(gen: PQGen[RV], fileno: int, interval: float | None = None) ->
     """
     try:
         s = next(gen)
+        send = gen.send
         with DefaultSelector() as sel:
+            select_ = sel.select
             sel.register(fileno, s)
             while True:
-                rlist = sel.select(timeout=interval)
+                rlist = select_(timeout=interval)
                 if not rlist:
-                    gen.send(READY_NONE)
+                    send(READY_NONE)
                     continue
 
-                sel.unregister(fileno)
+                # Keep the fd registered across iterations and only update
+                # the events we are interested in if they have changed.
                 ready = rlist[0][1]
-                s = gen.send(ready)
-                sel.register(fileno, s)
+                s1 = send(ready)
+                if s1 != s:
+                    s = s1
+                    sel.modify(fileno, s)
 
     except StopIteration as ex:
         rv: RV = ex.value
@@ -85,18 +94,22 @@ def wait_conn(gen: PQGenConn[RV], interval: float | None = None) -> RV:
         fileno, s = next(gen)
         if not interval:
             interval = None
+        send = gen.send
         with DefaultSelector() as sel:
-            sel.register(fileno, s)
+            register = sel.register
+            select_ = sel.select
+            unregister = sel.unregister
+            register(fileno, s)
             while True:
-                rlist = sel.select(timeout=interval)
+                rlist = select_(timeout=interval)
                 if not rlist:
-                    gen.send(READY_NONE)
+                    send(READY_NONE)
                     continue
 
-                sel.unregister(fileno)
+                unregister(fileno)
                 ready = rlist[0][1]
-                fileno, s = gen.send(ready)
-                sel.register(fileno, s)
+                fileno, s = send(ready)
+                register(fileno, s)
 
     except StopIteration as ex:
         rv: RV = ex.value
@@ -116,17 +129,33 @@ async def wait_async(gen: PQGen[RV], fileno: int, interval: float | None = None)
 
     Behave like in `wait()`, but exposing an `asyncio` interface.
     """
-    # Use an event to block and restart after the fd state changes.
-    # Not sure this is the best implementation but it's a start.
-    ev = Event()
+    # Use a future to block and restart after the fd state changes.
     loop = get_event_loop()
+    fut: Future[None]
     ready: int
+    watching = 0  # the Wait directions registered in the loop
     s: Wait
 
     def wakeup(state: Ready) -> None:
-        nonlocal ready
+        nonlocal ready, watching
         ready |= state
-        ev.set()
+        # Only stop watching the direction that fired: if the other callback
+        # was scheduled in the same loop iteration, it will add its state too.
+        if state & READY_R:
+            loop.remove_reader(fileno)
+        else:
+            loop.remove_writer(fileno)
+        watching &= ~state
+        if not fut.done():
+            fut.set_result(None)
+
+    def unwatch() -> None:
+        nonlocal watching
+        if watching & WAIT_R:
+            loop.remove_reader(fileno)
+        if watching & WAIT_W:
+            loop.remove_writer(fileno)
+        watching = 0
 
     try:
         s = next(gen)
@@ -135,25 +164,25 @@ async def wait_async(gen: PQGen[RV], fileno: int, interval: float | None = None)
             writer = s & WAIT_W
             if not reader and not writer:
                 raise e.InternalError(f"bad poll status: {s}")
-            ev.clear()
+            fut = loop.create_future()
             ready = 0
             if reader:
                 loop.add_reader(fileno, wakeup, READY_R)
+                watching = WAIT_R
             if writer:
                 loop.add_writer(fileno, wakeup, READY_W)
+                watching |= WAIT_W
             try:
                 if interval is not None:
                     try:
-                        await wait_for(ev.wait(), interval)
+                        await wait_for(fut, interval)
                     except TimeoutError:
                         pass
                 else:
-                    await ev.wait()
+                    await fut
             finally:
-                if reader:
-                    loop.remove_reader(fileno)
-                if writer:
-                    loop.remove_writer(fileno)
+                # Remove the directions which haven't fired, if any.
+                unwatch()
             s = gen.send(ready)
 
     except OSError as ex:
@@ -177,17 +206,33 @@ async def wait_conn_async(gen: PQGenConn[RV], interval: float | None = None) ->
     Behave like in `wait()`, but take the fileno to wait from the generator
     itself, which might change during processing.
     """
-    # Use an event to block and restart after the fd state changes.
-    # Not sure this is the best implementation but it's a start.
-    ev = Event()
+    # Use a future to block and restart after the fd state changes.
     loop = get_event_loop()
-    ready: Ready
+    fut: Future[None]
+    ready: int
+    watching = 0  # the Wait directions registered in the loop
     s: Wait
 
     def wakeup(state: Ready) -> None:
-        nonlocal ready
-        ready = state
-        ev.set()
+        nonlocal ready, watching
+        ready |= state
+        # Only stop watching the direction that fired: if the other callback
+        # was scheduled in the same loop iteration, it will add its state too.
+        if state & READY_R:
+            loop.remove_reader(fileno)
+        else:
+            loop.remove_writer(fileno)
+        watching &= ~state
+        if not fut.done():
+            fut.set_result(None)
+
+    def unwatch() -> None:
+        nonlocal watching
+        if watching & WAIT_R:
+            loop.remove_reader(fileno)
+        if watching & WAIT_W:
+            loop.remove_writer(fileno)
+        watching = 0
 
     try:
         fileno, s = next(gen)
@@ -196,25 +241,25 @@ async def wait_conn_async(gen: PQGenConn[RV], interval: float | None = None) ->
             writer = s & WAIT_W
             if not reader and not writer:
                 raise e.InternalError(f"bad poll status: {s}")
-            ev.clear()
-            ready = 0  # type: ignore[assignment]
+            fut = loop.create_future()
+            ready = 0
             if reader:
                 loop.add_reader(fileno, wakeup, READY_R)
+                watching = WAIT_R
             if writer:
                 loop.add_writer(fileno, wakeup, READY_W)
+                watching |= WAIT_W
             try:
                 if interval:
                     try:
-                        await wait_for(ev.wait(), interval)
+                        await wait_for(fut, interval)
                     except TimeoutError:
                         pass
                 else:
-                    await ev.wait()
+                    await fut
             finally:
-                if reader:
-                    loop.remove_reader(fileno)
-                if writer:
-                    loop.remove_writer(fileno)
+                # Remove the directions which haven't fired, if any.
+                unwatch()
             fileno, s = gen.send(ready)
 
     except StopIteration as ex:
@@ -236,18 +281,12 @@ def wait_select(gen: PQGen[RV], fileno: int, interval: float | None = None) -> R
 
         empty = ()
         fnlist = (fileno,)
+        # The (rlist, wlist) arguments to pass to select, indexed by Wait value.
+        rwlists = ((empty, empty), (fnlist, empty), (empty, fnlist), (fnlist, fnlist))
         while True:
-            rl, wl, xl = select.select(
-                fnlist if s & WAIT_R else empty,
-                fnlist if s & WAIT_W else empty,
-                fnlist,
-                interval,
-            )
-            ready = 0
-            if rl:
-                ready = READY_R
-            if wl:
-                ready |= READY_W
+            rlist, wlist = rwlists[s]
+            rl, wl, xl = select.select(rlist, wlist, fnlist, interval)
+            ready = _READY_FROM_RW[bool(rl) | bool(wl) << 1]
             if not ready:
                 gen.send(READY_NONE)
                 continue
@@ -259,15 +298,31 @@ def wait_select(gen: PQGen[RV], fileno: int, interval: float | None = None) -> R
         return rv
 
 
+# The event masks are indexed by the Wait value: a tuple lookup is much faster
+# than hashing an enum for a dict lookup.
+
 if hasattr(selectors, "EpollSelector"):
-    _epoll_evmasks = {
-        WAIT_R: select.EPOLLONESHOT | select.EPOLLIN | select.EPOLLERR,
-        WAIT_W: select.EPOLLONESHOT | select.EPOLLOUT | select.EPOLLERR,
-        WAIT_RW: select.EPOLLONESHOT
-        | (select.EPOLLIN | select.EPOLLOUT | select.EPOLLERR),
-    }
+    _epoll_evmasks: tuple[int, ...] = (
+        0,
+        select.EPOLLIN | select.EPOLLERR,  # WAIT_R
+        select.EPOLLOUT | select.EPOLLERR,  # WAIT_W
+        select.EPOLLIN | select.EPOLLOUT | select.EPOLLERR,  # WAIT_RW
+    )
+
+    # The Ready value for every combination of the events epoll can report
+    # (errors and hangups wake up both a reader and a writer), so that
+    # decoding the events takes a single lookup.
+    _epoll_events = select.EPOLLIN | select.EPOLLOUT | select.EPOLLERR | select.EPOLLHUP
+    _epoll_rmask = select.EPOLLIN | select.EPOLLERR | select.EPOLLHUP
+    _epoll_wmask = select.EPOLLOUT | select.EPOLLERR | select.EPOLLHUP
+    _epoll_ready: tuple[Ready, ...] = tuple(
+        _READY_FROM_RW[bool(ev & _epoll_rmask) | bool(ev & _epoll_wmask) << 1]
+        for ev in range(_epoll_events + 1)
+    )
 else:
-    _epoll_evmasks = {}
+    _epoll_evmasks = ()
+    _epoll_events = 0
+    _epoll_ready = ()
 
 
 def wait_epoll(gen: PQGen[RV], fileno: int, interval: float | None = None) -> RV:
@@ -290,25 +345,24 @@ def wait_epoll(gen: PQGen[RV], fileno: int, interval: float | None = None) -> RV
         s = next(gen)
 
         if interval is None or interval < 0:
-            interval = 0.0
+            interval = -1.0  # wait indefinitely
 
+        send = gen.send
+        ready_table = _epoll_ready
         with select.epoll() as epoll:
-            evmask = _epoll_evmasks[s]
-            epoll.register(fileno, evmask)
+            poll = epoll.poll
+            # The fd is registered level-triggered and stays armed across
+            # iterations: we only need to modify it if the state changes.
+            epoll.register(fileno, _epoll_evmasks[s])
             while True:
-                fileevs = epoll.poll(interval)
+                fileevs = poll(interval)
                 if not fileevs:
-                    gen.send(READY_NONE)
+                    send(READY_NONE)
                     continue
-                ev = fileevs[0][1]
-                ready = 0
-                if ev & ~select.EPOLLOUT:
-                    ready = READY_R
-                if ev & ~select.EPOLLIN:
-                    ready |= READY_W
-                s = gen.send(ready)
-                evmask = _epoll_evmasks[s]
-                epoll.modify(fileno, evmask)
+                s1 = send(ready_table[fileevs[0][1] & _epoll_events])
+                if s1 != s:
+                    s = s1
+                    epoll.modify(fileno, _epoll_evmasks[s])
 
     except StopIteration as ex:
         rv: RV = ex.value
@@ -316,13 +370,14 @@ def wait_epoll(gen: PQGen[RV], fileno: int, interval: float | None = None) -> RV
 
 
 if hasattr(selectors, "PollSelector"):
-    _poll_evmasks = {
-        WAIT_R: select.POLLIN,
-        WAIT_W: select.POLLOUT,
-        WAIT_RW: select.POLLIN | select.POLLOUT,
-    }
+    _poll_evmasks: tuple[int, ...] = (
+        0,
+        select.POLLIN,  # WAIT_R
+        select.POLLOUT,  # WAIT_W
+        select.POLLIN | select.POLLOUT,  # WAIT_RW
+    )
 else:
-    _poll_evmasks = {}
+    _poll_evmasks = ()
 
 
 def wait_poll(gen: PQGen[RV], fileno: int, interval: float | None = None) -> RV:
@@ -335,7 +390,7 @@ def wait_poll(gen: PQGen[RV], fileno: int, interval: float | None = None) -> RV:
         s = next(gen)
 
         if interval is None or interval < 0:
-            interval = 0
+            interval = -1  # wait indefinitely
         else:
             interval = int(interval * 1000.0)
 
@@ -349,11 +404,9 @@ def wait_poll(gen: PQGen[RV], fileno: int, interval: float | None = None) -> RV:
                 continue
 
             ev = fileevs[0][1]
-            ready = 0
-            if ev & ~select.POLLOUT:
-                ready = READY_R
-            if ev & ~select.POLLIN:
-                ready |= READY_W
+            ready = _READY_FROM_RW[
+                bool(ev & ~select.POLLOUT) | bool(ev & ~select.POLLIN) << 1
+            ]
             s = gen.send(ready)
             evmask = _poll_evmasks[s]
             poll.modify(fileno, evmask)
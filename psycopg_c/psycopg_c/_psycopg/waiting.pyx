@@ -78,8 +78,10 @@ retry_eintr:
     select_rv = poll(&input_fd, 1, timeout_ms);
     Py_END_ALLOW_THREADS
 
-    /* The grace of PEP 475 */
+    /* The grace of PEP 475: run the signal handlers and retry, unless they
+     * raised an exception, e.g. KeyboardInterrupt on Ctrl-C. */
     if (errno == EINTR) {
+        if (PyErr_CheckSignals()) { goto finally; }
         goto retry_eintr;
     }
 
@@ -133,8 +135,10 @@ retry_eintr:
     select_rv = select(fileno + 1, &ifds, &ofds, &efds, tvptr);
     Py_END_ALLOW_THREADS
 
-    /* The grace of PEP 475 */
+    /* The grace of PEP 475: run the signal handlers and retry, unless they
+     * raised an exception, e.g. KeyboardInterrupt on Ctrl-C. */
     if (errno == EINTR) {
+        if (PyErr_CheckSignals()) { goto finally; }
         goto retry_eintr;
     }
 
@@ -183,7 +187,13 @@ def wait_c(gen: PQGen[RV], int fileno, interval = None) -> RV:
     """
     cdef float cinterval
     cdef int wait, ready
-    cdef PyObject *pyready
+    cdef PyObject *pyready_values[4]
+
+    # Map the ready state returned by wait_c_impl() to the object to send.
+    pyready_values[READY_NONE] = <PyObject *>PY_READY_NONE
+    pyready_values[READY_R] = <PyObject *>PY_READY_R
+    pyready_values[READY_W] = <PyObject *>PY_READY_W
+    pyready_values[READY_RW] = <PyObject *>PY_READY_RW
 
     if interval is None:
         cinterval = -1.0
@@ -199,18 +209,10 @@ def wait_c(gen: PQGen[RV], int fileno, interval = None) -> RV:
 
         while True:
             ready = wait_c_impl(fileno, wait, cinterval)
-            if ready == READY_NONE:
-                pyready = <PyObject *>PY_READY_NONE
-            elif ready == READY_R:
-                pyready = <PyObject *>PY_READY_R
-            elif ready == READY_RW:
-                pyready = <PyObject *>PY_READY_RW
-            elif ready == READY_W:
-                pyready = <PyObject *>PY_READY_W
-            else:
+            if ready & ~READY_RW:
                 raise AssertionError(f"unexpected ready value: {ready}")
 
-            wait = PyObject_CallFunctionObjArgs(send, pyready, NULL)
+            wait = PyObject_CallFunctionObjArgs(send, pyready_values[ready], NULL)
 
     except StopIteration as ex:
         rv: RV = ex.value
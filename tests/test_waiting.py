@@ -1,7 +1,9 @@
 import sys
 import time
 import select  # noqa: used in pytest.mark.skipif
+import signal
 import socket
+import threading
 
 import pytest
 
@@ -32,6 +34,14 @@ intervals = [pytest.param({}, id="blank")]
 intervals += [pytest.param({"interval": x}, id=str(x)) for x in [None, 0, 0.2, 10]]
 
 
+@pytest.fixture
+def socketpair():
+    """Return a pair of connected sockets, closed at the end of the test."""
+    rsock, wsock = socket.socketpair()
+    with rsock, wsock:
+        yield rsock, wsock
+
+
 @pytest.mark.parametrize("timeout", intervals)
 def test_wait_conn(dsn, timeout):
     gen = generators.connect(dsn)
@@ -62,6 +72,95 @@ def test_wait_ready(waitfn, event):
     assert r & ready
 
 
+@pytest.mark.parametrize("waitfn", waitfns)
+@skip_if_not_linux
+def test_wait_ready_change(waitfn, socketpair):
+    waitfn = getattr(waiting, waitfn)
+    rsock, wsock = socketpair
+
+    def gen():
+        r1 = yield waiting.Wait.W
+        r2 = yield waiting.Wait.R
+        r3 = yield waiting.Wait.R
+        r4 = yield waiting.Wait.RW
+        return r1, r2, r3, r4
+
+    wsock.send(b"x")
+    r1, r2, r3, r4 = waitfn(gen(), rsock.fileno())
+
+    assert r1 & waiting.Ready.W
+    assert r2 & waiting.Ready.R
+    assert r3 & waiting.Ready.R
+    assert r4 == waiting.Ready.RW
+
+
+@pytest.mark.timing
+@pytest.mark.parametrize("waitfn", waitfns)
+@skip_if_not_linux
+def test_wait_signal(waitfn, socketpair):
+    waitfn = getattr(waiting, waitfn)
+    rsock, wsock = socketpair
+
+    class Alarm(Exception):
+        pass
+
+    def handler(signum, frame):
+        raise Alarm
+
+    def gen():
+        while True:
+            yield waiting.Wait.R
+
+    old_handler = signal.signal(signal.SIGALRM, handler)
+    try:
+        signal.setitimer(signal.ITIMER_REAL, 0.1)
+        t0 = time.time()
+        with pytest.raises(Alarm):
+            waitfn(gen(), rsock.fileno(), interval=2.0)
+        # The signal must interrupt the wait, not only the end of the interval
+        assert time.time() - t0 < 1.0
+    finally:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+        signal.signal(signal.SIGALRM, old_handler)
+
+
+@pytest.mark.parametrize(
+    "waitfn",
+    [
+        pytest.param(
+            "wait_epoll", marks=pytest.mark.skipif("not hasattr(select, 'epoll')")
+        ),
+        pytest.param(
+            "wait_poll", marks=pytest.mark.skipif("not hasattr(select, 'poll')")
+        ),
+    ],
+)
+@skip_if_not_linux
+def test_wait_no_interval(waitfn, socketpair):
+    waitfn = getattr(waiting, waitfn)
+    rsock, wsock = socketpair
+    written = threading.Event()
+
+    def write():
+        written.set()
+        wsock.send(b"x")
+
+    def gen():
+        r = yield waiting.Wait.R
+        # With no interval the wait must block until the fd is ready
+        assert written.is_set()
+        return r
+
+    t = threading.Timer(0.1, write)
+    t.start()
+    try:
+        r = waitfn(gen(), rsock.fileno(), interval=None)
+    finally:
+        t.join()
+
+    assert r & waiting.Ready.R
+
+
 @pytest.mark.parametrize("waitfn", waitfns)
 @pytest.mark.parametrize("timeout", intervals)
 def test_wait(pgconn, waitfn, timeout):
@@ -177,6 +276,52 @@ async def test_wait_ready_async(event):
     assert r & ready
 
 
+def gen_rw(fileno):
+    r = yield waiting.Wait.RW
+    return r
+
+
+def gen_conn_rw(fileno):
+    r = yield fileno, waiting.Wait.RW
+    return r
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize(
+    "waitfn, genfn",
+    [
+        pytest.param(
+            lambda gen, fileno: waiting.wait_async(gen, fileno), gen_rw, id="async"
+        ),
+        pytest.param(
+            lambda gen, fileno: waiting.wait_conn_async(gen), gen_conn_rw, id="conn"
+        ),
+    ],
+)
+@skip_if_not_linux
+async def test_wait_ready_rw_async(waitfn, genfn, socketpair):
+    rsock, wsock = socketpair
+    wsock.send(b"x")
+    r = await waitfn(genfn(rsock.fileno()), rsock.fileno())
+    assert r == waiting.Ready.RW
+
+
+@pytest.mark.anyio
+@skip_if_not_linux
+async def test_wait_async_interval(socketpair):
+    rsock, wsock = socketpair
+
+    def gen():
+        r1 = yield waiting.Wait.R
+        wsock.send(b"x")
+        r2 = yield waiting.Wait.R
+        return r1, r2
+
+    r1, r2 = await waiting.wait_async(gen(), rsock.fileno(), interval=0.05)
+    assert r1 == waiting.Ready.NONE
+    assert r2 & waiting.Ready.R
+
+
 @pytest.mark.anyio
 async def test_wait_async(pgconn):
     pgconn.send_query(b"select 1")